@@ -184,6 +184,32 @@ async def process_user_input(
         )
 
 
+async def _stream_tts(
+    openai_service, text: str, voice: str, speed: float, filename: str
+) -> StreamingResponse:
+    """Stream TTS audio as it is synthesized"""
+    audio_stream = openai_service.text_to_speech_stream(
+        text=text, voice=voice, speed=speed
+    )
+    # Pull the first chunk up front so synthesis errors still return HTTP 500
+    first_chunk = await audio_stream.__anext__()
+
+    async def audio_streamer():
+        try:
+            yield first_chunk
+            async for chunk in audio_stream:
+                yield chunk
+        finally:
+            # Release the upstream TTS response if the client disconnects early
+            await audio_stream.aclose()
+
+    return StreamingResponse(
+        audio_streamer(),
+        media_type="audio/mpeg",
+        headers={"Content-Disposition": f"inline; filename={filename}"},
+    )
+
+
 # Text-to-Speech Endpoints (Urgently needed by frontend!)
 @router.post("/tts")
 async def text_to_speech(
@@ -196,31 +222,8 @@ async def text_to_speech(
     try:
         logger.info(f"🔊 TTS request for text: '{request.text[:50]}...'")
 
-        # Debug: Check if text_to_speech is a coroutine function
-        import inspect
-
-        logger.info(
-            f"🔍 is coroutine? {inspect.iscoroutinefunction(openai_service.text_to_speech)}"
-        )
-
-        # Generate TTS audio
-        audio_bytes = await openai_service.text_to_speech(
-            text=request.text, voice=request.voice, speed=request.speed
-        )
-
-        # Return audio as streaming response
-        # Use asynchronous generator function to stream audio data
-        async def audio_streamer():
-            # Return audio data in one go
-            yield audio_bytes
-
-        return StreamingResponse(
-            audio_streamer(),
-            media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": "inline; filename=tts_audio.mp3",
-                "Content-Length": str(len(audio_bytes)),
-            },
+        return await _stream_tts(
+            openai_service, request.text, request.voice, request.speed, "tts_audio.mp3"
         )
 
     except Exception as e:
@@ -263,16 +266,8 @@ async def text_to_speech_get(
     Usage: /api/ai-host/tts/HelloWorld?voice=nova&speed=1.0
     """
     try:
-        # Generate TTS audio
-        audio_bytes = await openai_service.text_to_speech(
-            text=text, voice=voice, speed=speed
-        )
-
-        # Return audio as streaming response
-        return StreamingResponse(
-            io.BytesIO(audio_bytes),
-            media_type="audio/mpeg",
-            headers={"Content-Disposition": f"inline; filename=tts_{text[:10]}.mp3"},
+        return await _stream_tts(
+            openai_service, text, voice, speed, f"tts_{text[:10]}.mp3"
         )
 
     except Exception as e:
@@ -1083,7 +1078,7 @@ async def _handle_realtime_streaming(websocket: WebSocket, openai_service, sessi
     logger.info("🔗 Establishing persistent GPT-4o Realtime connection...")
     
     # Use proper async context manager for the Realtime connection
-    async with openai_service.async_client.beta.realtime.connect(
+    async with openai_service.client.beta.realtime.connect(
         model="gpt-4o-realtime-preview"
     ) as conn:
         try:
@@ -1474,7 +1469,7 @@ async def ai_host_health_check(openai_service=Depends(get_openai_service)):
     try:
         # Check OpenAI connectivity
         if openai_service:
-            openai_health = openai_service.health_check()
+            openai_health = await openai_service.health_check()
         else:
             openai_health = {
                 "status": "unavailable",
@@ -556,6 +556,7 @@ async def handle_voice_message(
             audio_data=audio_data,
             conversation_context=conversation_context,
             room_participants=room_participants,
+            room_id=room_id,
             moderation_mode="active_host"
         )
         
@@ -642,6 +643,7 @@ async def handle_text_message(
             text_input=text_content,
             conversation_context=conversation_context,
             room_participants=room_participants,
+            room_id=room_id,
             moderation_mode="secretary"  # More subtle for text
         )
         
@@ -689,6 +691,7 @@ async def handle_ai_assistance_request(
             text_input=f"User requested AI assistance, type: {request_type}",
             conversation_context=conversation_context,
             room_participants=room_participants,
+            room_id=room_id,
             moderation_mode="fact_checker" if request_type == "fact_check" else "active_host"
         )
         
@@ -726,6 +729,7 @@ async def handle_conversation_pause(
             text_input="Conversation has paused, providing topic suggestions to keep it lively",
             conversation_context=conversation_context,
             room_participants=room_participants,
+            room_id=room_id,
             moderation_mode="active_host"
         )
         
@@ -0,0 +1,146 @@
+"""
+Batch Queue for AI requests
+Coalesces concurrent requests into micro-batches handled by a single upstream call
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchQueue(Generic[T, R]):
+    """
+    Micro-batching coalescer
+
+    While no batch is in flight, a request is dispatched immediately (together with
+    anything already queued), so idle traffic pays no extra latency. While batches
+    are in flight, new requests are collected for up to ``window_ms`` or until
+    ``max_batch`` items and dispatched together.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[List[R]]],
+        window_ms: float = 25,
+        max_batch: int = 16,
+    ):
+        """
+        Initialize batch queue
+
+        Args:
+            handler: Coroutine taking a batch of items and returning one result (or
+                exception) per item, in order
+            window_ms: Maximum time to wait for more items while busy
+            max_batch: Maximum items per batch
+        """
+        self.handler = handler
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """
+        Enqueue an item and wait for its result
+
+        Args:
+            item: Request payload
+
+        Returns:
+            Result produced by the handler for this item
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the dispatcher, fail queued requests and wait for in-flight batches"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        # Requests that never reached a batch would otherwise wait forever
+        if self._queue is not None:
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._fail(pending, RuntimeError("BatchQueue closed"))
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[T, asyncio.Future]], error: Exception) -> None:
+        """Resolve every unresolved future in a batch with an exception"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _run(self) -> None:
+        """Collect queued items into batches and dispatch them"""
+        while True:
+            batch: List[Tuple[T, asyncio.Future]] = [await self._queue.get()]
+            try:
+                await self._collect(batch)
+            except asyncio.CancelledError:
+                # Closed while collecting: don't strand the items already taken off the queue
+                self._fail(batch, RuntimeError("BatchQueue closed"))
+                raise
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _collect(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Add more queued items to a batch according to the busy/idle policy"""
+        loop = asyncio.get_running_loop()
+        if self._inflight:
+            # Busy: wait briefly so concurrent callers share one upstream call
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        else:
+            # Idle: dispatch now with whatever is already waiting
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+    async def _dispatch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Run the handler for one batch and resolve its futures"""
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch handler returned {len(results)} results for {len(batch)} items"
+                )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                # Handlers may report per-item failures by returning the exception
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except Exception as e:
+            logger.error(f"❌ Batch of {len(batch)} failed: {e}")
+            self._fail(batch, e)
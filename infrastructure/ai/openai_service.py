@@ -4,19 +4,206 @@ Unified voice and text processing using latest GPT-4o audio capabilities
 """
 
 import base64
+import copy
+import hashlib
 import logging
+import cachetools
+import diskcache
+import ffmpeg
+import httpx
 import openai
-from openai import AsyncOpenAI, DefaultAioHttpClient
-from typing import Dict, List, Any, Optional, Union, AsyncGenerator
-from datetime import datetime
-import json
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from typing import Dict, List, Any, Optional, Tuple, Union, AsyncGenerator
+from datetime import datetime, timezone
+import orjson
 import asyncio
 import io
 import tempfile
 import os
+import re
+import time
+from .batch_queue import BatchQueue
+from .semantic_cache import SemanticCache
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 logger = logging.getLogger(__name__)
 
+# Embedding model for the topic semantic cache; 256 native dimensions keep the index small
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_EMBEDDING_DIMENSIONS = 256
+
+# Upload formats (file extension / MIME subtype) GPT-4o Audio accepts as input_audio
+_GPT4O_AUDIO_INPUT_FORMATS = {
+    "wav": "wav",
+    "wave": "wav",
+    "x-wav": "wav",
+    "mp3": "mp3",
+    "mpeg": "mp3",
+}
+
+# Largest upload sent to the fused GPT-4o Audio call (~1 min of speech). Its verbatim
+# transcript must fit in the 500-token reply; longer clips go straight to the fallback
+_GPT4O_AUDIO_MAX_BYTES = 1024 * 1024
+
+# Default request timeout for the shared HTTP client (chat, TTS, embeddings)
+_DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Non-streamed audio-input calls return nothing until the whole upload is processed;
+# long recordings need the SDK's default read budget instead of 60 s
+_AUDIO_INPUT_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+def _is_transient_openai_error(e: BaseException) -> bool:
+    """Same failures the OpenAI SDK retries itself: connection errors/timeouts, 408, 409, 429 and 5xx"""
+    if isinstance(e, openai.APIConnectionError):  # includes APITimeoutError
+        return True
+    if isinstance(e, openai.APIStatusError):
+        return e.status_code in (408, 409, 429) or e.status_code >= 500
+    return False
+
+
+# Transient OpenAI failures worth retrying with jittered exponential backoff
+_openai_retry = retry(
+    wait=wait_random_exponential(min=1, max=20),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(_is_transient_openai_error),
+    reraise=True,
+)
+
+
+# Static system prompts kept byte-identical across calls so OpenAI prompt caching can
+# reuse their prefix; per-call values are sent in a trailing message instead
+_MATCHING_SYSTEM_PROMPT = """You are Vortex, an expert at analyzing voice input for social matching.
+
+Your task:
+1. Listen to the user's voice input and understand what they want to discuss
+2. Extract 3-5 main topics from their speech
+3. Generate 5-8 relevant hashtags for matching users with similar interests
+4. Classify the category, sentiment and conversation style
+5. Respond with encouragement about finding conversation partners
+
+Respond in this exact JSON format:
+{
+    "understood_text": "exact transcription of what they said",
+    "extracted_topics": ["Topic1", "Topic2", "Topic3"],
+    "generated_hashtags": ["#hashtag1", "#hashtag2", "#hashtag3", "#hashtag4", "#hashtag5"],
+    "category": "technology|business|lifestyle|entertainment|education|sports|health|travel|other",
+    "sentiment": "positive|negative|neutral",
+    "conversation_style": "casual|professional|academic|creative",
+    "summary": "Brief summary of what the user wants to discuss",
+    "text_response": "Great! I understand you want to discuss [topics]. Let me find you someone interesting to chat with!"
+}
+
+Focus on creating hashtags that help match users effectively."""
+
+_MODERATION_SYSTEM_PROMPT = """You are Vortex, an intelligent room host and chat secretary.
+
+Your responsibilities:
+1. Engage the conversation: Actively provide topics when the conversation is cold
+2. Fact Check: When participants mention potentially inaccurate information, provide friendly verification
+3. Comment: Respond appropriately to conversation content and provide suggestions
+4. Content Moderation: Ensure the conversation is friendly and harmonious
+5. Assistive Guidance: Help participants communicate better
+
+Please provide an appropriate response based on the input content, which can be a voice response, a text suggestion, or a topic recommendation.
+The response should be natural, friendly, and helpful."""
+
+_TOPIC_SYSTEM_PROMPT = """You are Vortex, an expert at analyzing conversation topics and generating relevant hashtags for social matching.
+
+Your task is to analyze the user's input and extract:
+1. Main topics (3-5 specific topics)
+2. Relevant hashtags (5-8 hashtags for matching)
+3. Category classification
+4. Sentiment analysis
+5. Conversation style preference
+
+Please respond in JSON format:
+{
+    "main_topics": ["Topic1", "Topic2", "Topic3"],
+    "hashtags": ["#hashtag1", "#hashtag2", "#hashtag3", "#hashtag4", "#hashtag5"],
+    "category": "technology|business|lifestyle|entertainment|education|sports|health|travel|other",
+    "sentiment": "positive|negative|neutral",
+    "conversation_style": "casual|professional|academic|creative",
+    "confidence": 0.95,
+    "summary": "Brief summary of what the user wants to discuss"
+}
+
+Focus on creating hashtags that will help match users with similar interests."""
+
+_ROOM_SUMMARY_SYSTEM_PROMPT = """Summarize this voice-room conversation for the room host in at most 5 sentences.
+Keep the topics discussed, who said what when it matters, open questions and any claims that may need fact-checking.
+If an existing summary is provided, merge the new messages into it."""
+
+# Output ceiling for one batched topic call (gpt-4o-mini max completion tokens)
+_TOPIC_BATCH_MAX_TOKENS = 16000
+
+# A batch is one sequential generation, so keep batches small: past a few inputs,
+# parallel single calls under the semaphore finish sooner
+_TOPIC_BATCH_MAX_SIZE = 4
+
+# Conservative gpt-4o-mini output rate used to size the batch call's read timeout
+_TOPIC_BATCH_TOKENS_PER_SECOND = 50
+
+_TOPIC_BATCH_INSTRUCTIONS = """The user message is a JSON array of inputs, each with "text", "language" and "context".
+Analyze every input independently and respond with a JSON object of the form {"results": [...]},
+where results[i] is the JSON analysis described above for input i."""
+
+
+# In-memory TTS cache budget (bytes); larger clips are kept on disk only
+_TTS_MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+_TTS_MEMORY_CACHE_MAX_ITEM = 1024 * 1024
+
+
+# Seconds a healthy health_check() result is reused
+_HEALTH_CHECK_TTL = 5.0
+
+
+# Single case-insensitive pass over moderator replies; word-start anchored so
+# "suggestion", "topics" and "information" still count
+_SUGGESTION_KEYWORDS_RE = re.compile(r"\b(suggest|topic|fact|info)", re.IGNORECASE)
+
+
+def _utc_timestamp() -> str:
+    """Timezone-aware UTC timestamp for response payloads"""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+# Payloads above this size are base64-encoded in a worker thread
+_B64_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+async def _to_b64(audio_data: bytes) -> str:
+    """
+    Base64-encode audio for the OpenAI SDK without blocking the event loop on large payloads.
+    """
+    if len(audio_data) > _B64_OFFLOAD_THRESHOLD:
+        encoded = await asyncio.to_thread(base64.b64encode, audio_data)
+    else:
+        encoded = base64.b64encode(audio_data)
+    return encoded.decode("ascii")
+
+
+# Smaller uploads go to Whisper as-is; transcoding them doesn't pay off
+_STT_TRANSCODE_THRESHOLD = 100 * 1024
+
+
+def _normalize_audio(data: bytes) -> bytes:
+    """
+    Transcode audio to 16 kHz mono Opus (Ogg) for Whisper.
+    Same transcription accuracy at a fraction of the upload size. Blocking; run in a thread.
+    """
+    out, _ = (
+        ffmpeg.input("pipe:0")
+        .output("pipe:1", format="ogg", acodec="libopus", ar=16000, ac=1, audio_bitrate="24k")
+        .run(input=data, capture_stdout=True, capture_stderr=True)
+    )
+    return out
+
 
 def _ensure_audio_bytes(audio_data) -> bytes:
     """
@@ -44,25 +231,201 @@ class OpenAIService:
             api_key: OpenAI API key
             base_url: Optional custom base URL for OpenAI API
         """
-        # Initialize both standard and async clients
-        if base_url:
-            self.client = openai.OpenAI(api_key=api_key, base_url=base_url)
-            self.async_client = AsyncOpenAI(
-                api_key=api_key, base_url=base_url, http_client=DefaultAioHttpClient()
-            )
-        else:
-            self.client = openai.OpenAI(api_key=api_key)
-            self.async_client = AsyncOpenAI(
-                api_key=api_key, http_client=DefaultAioHttpClient()
-            )
+        # Single pooled HTTP client shared by every call so TCP/TLS state is reused
+        self._http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+            timeout=_DEFAULT_TIMEOUT,
+            http2=True,
+        )
+        # Retries are handled by _openai_retry (same transient errors as the SDK's own
+        # retry policy) so the SDK must not retry as well; calls made outside the
+        # _create_* helpers opt back into SDK retries with with_options()
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=self._http_client,
+            max_retries=0,
+        )
         self.api_key = api_key
+
+        # Chat, TTS and STT have independent rate limits, so gate them separately
+        self._sem_chat = asyncio.Semaphore(int(os.getenv("OPENAI_CHAT_MAX_CONCURRENCY", 32)))
+        self._sem_tts = asyncio.Semaphore(int(os.getenv("OPENAI_TTS_MAX_CONCURRENCY", 16)))
+        self._sem_stt = asyncio.Semaphore(int(os.getenv("OPENAI_STT_MAX_CONCURRENCY", 16)))
+        self._sem_embed = asyncio.Semaphore(int(os.getenv("OPENAI_EMBED_MAX_CONCURRENCY", 32)))
+
+        # TTS output cache: in-memory LRU in front of an on-disk tier
+        self._tts_cache = cachetools.LRUCache(maxsize=_TTS_MEMORY_CACHE_BYTES, getsizeof=len)
+        tts_cache_dir = os.getenv("OPENAI_TTS_CACHE_DIR", "/var/cache/voiceapp/tts")
+        try:
+            self._tts_disk_cache = diskcache.Cache(directory=tts_cache_dir, size_limit=1 << 30)
+        except Exception as e:
+            logger.warning(f"⚠️ TTS disk cache unavailable at {tts_cache_dir}, using memory only: {e}")
+            self._tts_disk_cache = None
+
+        # Last healthy health_check() result and when it was taken (monotonic)
+        self._healthy_status: Optional[Dict[str, Any]] = None
+        self._healthy_at = 0.0
+
+        # Strong references to fire-and-forget tasks so they aren't garbage collected
+        self._background_tasks: set = set()
+
+        # Whisper results keyed on (audio hash, language)
+        self._stt_cache = cachetools.TTLCache(maxsize=4096, ttl=3600)
+
+        # Topic extraction cache keyed on input-text embedding similarity
+        self._topic_cache = SemanticCache(
+            dim=_EMBEDDING_DIMENSIONS,
+            threshold=float(os.getenv("OPENAI_TOPIC_CACHE_THRESHOLD", 0.92)),
+        )
+
+        # Rolling moderator summaries:
+        # (room_id, first message fingerprint) -> (messages summarized, last message fingerprint, summary)
+        self._room_summaries = cachetools.LRUCache(maxsize=1024)
+
+        # Coalesces near-simultaneous topic extraction requests into one call
+        self._topic_batcher = BatchQueue(
+            self._extract_topics_batch, window_ms=25, max_batch=_TOPIC_BATCH_MAX_SIZE
+        )
         logger.info("🎵 OpenAI Service initialized with GPT-4o Audio Preview support")
 
+    async def __aenter__(self) -> "OpenAIService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the OpenAI client and its shared HTTP connection pool"""
+        await self._topic_batcher.aclose()
+        # Background cache writes would otherwise run against the closed client
+        for task in self._background_tasks:
+            task.cancel()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self.client.close()
+        await self._http_client.aclose()
+        if self._tts_disk_cache is not None:
+            self._tts_disk_cache.close()
+        logger.info("🔌 OpenAI Service connections closed")
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    @staticmethod
+    def _tts_cache_key(model: str, voice: str, speed: float, text: str) -> str:
+        """Content hash identifying a TTS synthesis"""
+        return hashlib.blake2b(
+            f"{model}|{voice}|{speed}|{text}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    async def _tts_cache_get(self, key: str) -> Optional[bytes]:
+        """Look up cached TTS audio in memory, then on disk"""
+        audio_bytes = self._tts_cache.get(key)
+        if audio_bytes is None and self._tts_disk_cache is not None:
+            audio_bytes = await asyncio.to_thread(self._tts_disk_cache.get, key)
+            if audio_bytes is not None:
+                self._tts_memory_cache_set(key, audio_bytes)
+        return audio_bytes
+
+    def _tts_memory_cache_set(self, key: str, audio_bytes: bytes) -> None:
+        """Keep TTS audio in memory unless the clip is too large for the byte budget"""
+        if len(audio_bytes) <= _TTS_MEMORY_CACHE_MAX_ITEM:
+            self._tts_cache[key] = audio_bytes
+
+    async def _tts_cache_set(self, key: str, audio_bytes: bytes) -> None:
+        """Store TTS audio in both cache tiers"""
+        self._tts_memory_cache_set(key, audio_bytes)
+        if self._tts_disk_cache is not None:
+            try:
+                await asyncio.to_thread(self._tts_disk_cache.set, key, audio_bytes)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to write TTS disk cache: {e}")
+
+    @_openai_retry
+    async def _create_chat_completion(self, **kwargs):
+        """Rate-limited, retried chat.completions.create"""
+        async with self._sem_chat:
+            return await self.client.chat.completions.create(**kwargs)
+
+    @_openai_retry
+    async def _create_embedding(self, **kwargs):
+        """Rate-limited, retried embeddings.create"""
+        async with self._sem_embed:
+            return await self.client.embeddings.create(**kwargs)
+
+    @_openai_retry
+    async def _create_speech(self, **kwargs):
+        """Rate-limited, retried audio.speech.create"""
+        async with self._sem_tts:
+            return await self.client.audio.speech.create(**kwargs)
+
+    @_openai_retry
+    async def _open_speech_stream(self, **kwargs):
+        """
+        Rate-limited, retried audio.speech streaming request
+        
+        The TTS slot is held only until the response starts, so slow readers can't
+        exhaust it. The caller must close() the returned response.
+        """
+        async with self._sem_tts:
+            return await self.client.audio.speech.with_streaming_response.create(
+                **kwargs
+            ).__aenter__()
+
+    @_openai_retry
+    async def _create_transcription(self, **kwargs):
+        """Rate-limited, retried audio.transcriptions.create"""
+        # Rewind file-like inputs so a retry re-uploads the full audio
+        audio_file = kwargs.get("file")
+        if hasattr(audio_file, "seek"):
+            audio_file.seek(0)
+        kwargs.setdefault("timeout", _AUDIO_INPUT_TIMEOUT)
+        async with self._sem_stt:
+            return await self.client.audio.transcriptions.create(**kwargs)
+
+    async def _embed(self, text: str) -> List[float]:
+        """Embed text for semantic cache lookups"""
+        response = await self._create_embedding(
+            model=_EMBEDDING_MODEL, input=text, dimensions=_EMBEDDING_DIMENSIONS
+        )
+        return response.data[0].embedding
+
+    @staticmethod
+    def _topic_cache_scope(context: Optional[Dict[str, Any]], language: str) -> bytes:
+        """Everything besides the text that goes into a topic prompt; cache hits must match it"""
+        return orjson.dumps(
+            {"language": language, "context": context or {}}, option=orjson.OPT_SORT_KEYS
+        )
+
+    async def _remember_topics(
+        self,
+        text: str,
+        context: Optional[Dict[str, Any]],
+        language: str,
+        topic_result: Dict[str, Any],
+    ) -> None:
+        """Insert a topic extraction result into the semantic cache"""
+        try:
+            embedding = await self._embed(text)
+            self._topic_cache.add(
+                embedding,
+                copy.deepcopy(topic_result),
+                scope=self._topic_cache_scope(context, language),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to cache topics: {e}")
+
     async def process_voice_input_for_matching(
         self, 
         audio_data: Union[bytes, str],
         audio_format: str = "wav",
         language: str = "en-US",
+        generate_audio_response: bool = False,
     ) -> Dict[str, Any]:
         """
         Use GPT-4o Audio to directly process user voice input, extract topics and generate hashtags
@@ -74,6 +437,8 @@ class OpenAIService:
             audio_data: Audio data (bytes or base64 string)
             audio_format: Audio format (wav, mp3, etc.)
             language: Language preference
+            generate_audio_response: Also synthesize a spoken reply (Realtime API).
+                When False, a single text-only JSON call is made instead.
             
         Returns:
             {
@@ -90,28 +455,54 @@ class OpenAIService:
             
             # Check if audio_data is actual audio (base64) or just text
             is_audio_data = False
+            audio_base64 = None
             
             if isinstance(audio_data, bytes):
                 is_audio_data = True
-                audio_bytes = audio_data
+                audio_base64 = await _to_b64(audio_data)
             elif isinstance(audio_data, str):
                 # Check if it's base64 audio data (longer than typical text)
+                # Base64 input is passed through as-is, the APIs take base64 strings
                 if len(audio_data) > 1000 and not audio_data.startswith("data:"):
                     is_audio_data = True
-                    audio_bytes = base64.b64decode(audio_data)
+                    audio_base64 = audio_data
                 elif audio_data.startswith("data:"):
                     is_audio_data = True
                     # Extract base64 data from data URI
-                    audio_bytes = base64.b64decode(audio_data.split("base64,")[1])
-            else:
-                    # Short text, treat as text input
-                    audio_bytes = None
+                    audio_base64 = audio_data.split("base64,")[1]
+            
+            if is_audio_data and audio_base64 and not generate_audio_response:
+                input_format = _GPT4O_AUDIO_INPUT_FORMATS.get(audio_format.lower())
+                if len(audio_base64) * 3 // 4 > _GPT4O_AUDIO_MAX_BYTES:
+                    logger.info("🎵 Audio too long for GPT-4o Audio (text-only), using GPT-4o Realtime")
+                elif input_format:
+                    logger.info("🎵 Using GPT-4o Audio (text-only) for audio processing...")
+                    try:
+                        response_data = await self._gpt4o_audio_extract(
+                            audio_base64, input_format, language
+                        )
+                        
+                        result = {
+                            "understood_text": response_data.get("understood_text", ""),
+                            "extracted_topics": response_data.get("extracted_topics", []),
+                            "generated_hashtags": response_data.get("generated_hashtags", []),
+                            "text_response": response_data.get("text_response", ""),
+                            "confidence": 0.9,
+                            "processing_time": _utc_timestamp(),
+                        }
+                        
+                        logger.info(f"✅ GPT-4o Audio processing completed: topics={result.get('extracted_topics', [])}")
+                        return result
+                    except (openai.BadRequestError, ValueError) as e:
+                        logger.warning(f"⚠️ GPT-4o Audio extraction failed, falling back to GPT-4o Realtime: {e}")
+                else:
+                    logger.info(f"🎵 GPT-4o Audio does not accept {audio_format} input, using GPT-4o Realtime")
             
-            if is_audio_data and audio_bytes:
+            if is_audio_data and audio_base64:
                 logger.info("🎵 Using GPT-4o Realtime for audio processing...")
                 
                 # Use GPT-4o Realtime API for one-step audio processing
-                async with self.async_client.beta.realtime.connect(
+                async with self.client.beta.realtime.connect(
                     model="gpt-4o-realtime-preview"
                 ) as connection:
                     # Enable audio + text modalities
@@ -119,40 +510,20 @@ class OpenAIService:
                         session={"modalities": ["audio", "text"]}
                     )
                     
-                    # Send system prompt for topic extraction
-                    await connection.conversation.item.create(
-                        item={
-                            "type": "message",
-                        "role": "system", 
-                            "content": [
-                                {
-                                    "type": "input_text",
-                                    "text": f"""You are Vortex, an expert at analyzing voice input for social matching. 
-                            
-Your task:
-1. Listen to the user's voice input and understand what they want to discuss
-2. Extract 3-5 main topics from their speech
-3. Generate 5-8 relevant hashtags for matching users with similar interests
-4. Respond with encouragement about finding conversation partners
-
-Respond in this exact JSON format:
-{{
-    "understood_text": "exact transcription of what they said",
-    "extracted_topics": ["Topic1", "Topic2", "Topic3"],
-    "generated_hashtags": ["#hashtag1", "#hashtag2", "#hashtag3", "#hashtag4", "#hashtag5"],
-    "text_response": "Great! I understand you want to discuss [topics]. Let me find you someone interesting to chat with!"
-}}
-
-Language preference: {language}
-Focus on creating hashtags that help match users effectively."""
-                        }
-                            ]
-                        }
-                    )
+                    # Static prompt first so its prefix is cacheable; variable text goes last
+                    for prompt_text in (
+                        _MATCHING_SYSTEM_PROMPT,
+                        f"Language preference: {language}",
+                    ):
+                        await connection.conversation.item.create(
+                            item={
+                                "type": "message",
+                                "role": "system",
+                                "content": [{"type": "input_text", "text": prompt_text}],
+                            }
+                        )
                     
                     # Send user audio input using proper streaming method with keyword argument
-                    # Convert bytes to base64 string as required by OpenAI SDK
-                    audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
                     await connection.input_audio_buffer.append(audio=audio_base64)
             
                     # Request response
@@ -184,8 +555,7 @@ Focus on creating hashtags that help match users effectively."""
                     
                     # Try to parse JSON response
                     try:
-                        import json
-                        response_data = json.loads(full_response)
+                        response_data = orjson.loads(full_response)
                         
                         result = {
                             "understood_text": response_data.get("understood_text", ""),
@@ -193,17 +563,17 @@ Focus on creating hashtags that help match users effectively."""
                             "generated_hashtags": response_data.get("generated_hashtags", []),
                             "text_response": response_data.get("text_response", ""),
                             "confidence": 0.9,
-                            "processing_time": datetime.utcnow().isoformat(),
+                            "processing_time": _utc_timestamp(),
                         }
                         
                         # Add audio response if available
                         if audio_response:
-                            result["audio_response"] = base64.b64encode(audio_response).decode("utf-8")
+                            result["audio_response"] = await _to_b64(audio_response)
                             result["audio_format"] = "wav"
                         
                         logger.info(f"✅ GPT-4o Realtime processing completed: topics={result.get('extracted_topics', [])}")
                         return result
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         logger.warning("Failed to parse JSON from GPT-4o Realtime, using fallback")
                         # Fallback: extract topics from raw response
                         return {
@@ -212,7 +582,7 @@ Focus on creating hashtags that help match users effectively."""
                             "generated_hashtags": ["#chat", "#social"],
                             "text_response": "I understand you want to have a conversation. Let me find you someone to chat with!",
                             "confidence": 0.6,
-                            "processing_time": datetime.utcnow().isoformat(),
+                            "processing_time": _utc_timestamp(),
                             "raw_response": full_response
                         }
             else:
@@ -234,7 +604,7 @@ Focus on creating hashtags that help match users effectively."""
                     "match_intent": f"Wants to discuss: {', '.join(topic_result.get('main_topics', []))}",
                     "text_response": f"I understand you want to talk about {', '.join(topic_result.get('main_topics', []))}. Let me find you a great conversation partner!",
                     "confidence": topic_result.get("confidence", 0.8),
-                    "processing_time": datetime.utcnow().isoformat(),
+                    "processing_time": _utc_timestamp(),
                 }
             
         except Exception as e:
@@ -256,6 +626,7 @@ Focus on creating hashtags that help match users effectively."""
         conversation_context: List[Dict[str, Any]] = None,
         room_participants: List[str] = None,
         moderation_mode: str = "active_host",
+        room_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Use GPT-4o Audio as room AI host and secretary
@@ -273,6 +644,7 @@ Focus on creating hashtags that help match users effectively."""
             conversation_context: Conversation history
             room_participants: Room participants
             moderation_mode: Host mode (active_host, secretary, fact_checker)
+            room_id: Room identifier; enables a rolling summary of older messages
             
         Returns:
             AI host response (audio + text + suggestions)
@@ -280,106 +652,23 @@ Focus on creating hashtags that help match users effectively."""
         try:
             logger.info(f"🎭 AI moderating room conversation in {moderation_mode} mode...")
             
+            recent_context, context_summary = await self._condense_room_context(
+                room_id, conversation_context
+            )
             # Use GPT-4o Audio Preview with Realtime API
-            async with self.async_client.beta.realtime.connect(
+            async with self.client.beta.realtime.connect(
                 model="gpt-4o-realtime-preview"
             ) as connection:
-                # Configure session
-                await connection.session.update(
-                    session={
-                        "modalities": ["audio", "text"],
-                        "voice": "shimmer",
-                        "input_audio_format": "pcm16",
-                        "output_audio_format": "pcm16",
-                        "input_audio_transcription": {"model": "whisper-1"}
-                    }
+                await self._start_moderator_turn(
+                    connection,
+                    audio_data,
+                    text_input,
+                    recent_context,
+                    room_participants,
+                    moderation_mode,
+                    context_summary,
                 )
                 
-                # Send system prompt
-                await connection.conversation.item.create(
-                    item={
-                        "type": "message",
-                        "role": "system",
-                        "content": [
-                            {
-                                "type": "input_text",
-                                "text": f"""You are Vortex, an intelligent room host and chat secretary. Current mode: {moderation_mode}
-
-Your responsibilities:
-1. Engage the conversation: Actively provide topics when the conversation is cold
-2. Fact Check: When participants mention potentially inaccurate information, provide friendly verification
-3. Comment: Respond appropriately to conversation content and provide suggestions
-4. Content Moderation: Ensure the conversation is friendly and harmonious
-5. Assistive Guidance: Help participants communicate better
-
-Current room participants: {', '.join(room_participants or [])}
-
-Please provide an appropriate response based on the input content, which can be a voice response, a text suggestion, or a topic recommendation.
-The response should be natural, friendly, and helpful."""
-                            }
-                        ]
-                    }
-                )
-                
-                # Add conversation history
-                if conversation_context:
-                    for msg in conversation_context[-10:]:  # Last 10 messages
-                        await connection.conversation.item.create(
-                            item={
-                                "type": "message",
-                                "role": msg.get("role", "user"),
-                                "content": [
-                                    {
-                                        "type": "input_text",
-                                        "text": msg.get("content", "")
-                                    }
-                                ]
-                            }
-                        )
-                
-                # Prepare user content
-                user_content = []
-                
-                # Add audio if provided
-                if audio_data:
-                    if isinstance(audio_data, bytes):
-                        audio_base64 = base64.b64encode(audio_data).decode("utf-8")
-                    else:
-                        audio_base64 = audio_data
-                    
-                    # For moderation, use appendInputAudio instead of manual content creation
-                    # Convert base64 back to bytes for the API
-                    if isinstance(audio_data, str):
-                        audio_bytes = base64.b64decode(audio_data)
-                    else:
-                        audio_bytes = audio_data
-                    
-                    # Convert bytes to base64 string for OpenAI SDK
-                    if isinstance(audio_data, str):
-                        # Already base64, pass directly
-                        await connection.input_audio_buffer.append(audio=audio_data)
-                    else:
-                        # Raw bytes, need to encode
-                        audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
-                        await connection.input_audio_buffer.append(audio=audio_base64)
-                
-                # Add text if provided
-                if text_input:
-                    user_content.append({"type": "input_text", "text": text_input})
-                
-                # Only create conversation item if we have text content
-                if user_content:
-                    await connection.conversation.item.create(
-                        item={
-                            "type": "message",
-                            "role": "user",
-                            "content": user_content
-                        }
-                    )
-                
-                # Request response generation (works with audio from appendInputAudio)
-                await connection.response.create()
-                
                 # Process streaming response
                 text_chunks = []
                 audio_chunks = []
@@ -412,7 +701,7 @@ The response should be natural, friendly, and helpful."""
                     },
                     "moderation_type": moderation_mode,
                     "suggestions": self._extract_suggestions(text_response),
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _utc_timestamp(),
                     "participants": room_participants
                 }
                 
@@ -420,7 +709,7 @@ The response should be natural, friendly, and helpful."""
                 if audio_response:
                     # Convert raw PCM16 to WAV format for iOS compatibility
                     wav_audio = self._pcm16_to_wav(audio_response)
-                    result["ai_response"]["audio"] = base64.b64encode(wav_audio).decode("utf-8")
+                    result["ai_response"]["audio"] = await _to_b64(wav_audio)
                     result["ai_response"]["audio_format"] = "wav"
                 
                 return result
@@ -435,6 +724,245 @@ The response should be natural, friendly, and helpful."""
                 "error": str(e)
             }
 
+    async def moderate_room_conversation_stream(
+        self,
+        audio_data: Optional[Union[bytes, str]] = None,
+        text_input: Optional[str] = None,
+        conversation_context: List[Dict[str, Any]] = None,
+        room_participants: List[str] = None,
+        moderation_mode: str = "active_host",
+        room_id: Optional[str] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Streaming variant of moderate_room_conversation for incremental rendering
+        
+        Shares the moderator turn setup with moderate_room_conversation, so the final item
+        carries the same fields as its result; only the audio arrives as deltas instead of
+        one WAV.
+        
+        Args:
+            Same as moderate_room_conversation
+            
+        Yields:
+            {"delta": text or None, "audio": base64 PCM16 (24 kHz mono) chunk or None}
+            as the response is generated, then a final
+            {"done": True, "text": full text, "moderation_type", "suggestions", "timestamp", "participants"}
+            ({"done": True, "error": ...} on failure)
+        """
+        try:
+            logger.info(f"🎭 AI moderating room conversation (streaming) in {moderation_mode} mode...")
+            
+            recent_context, context_summary = await self._condense_room_context(
+                room_id, conversation_context
+            )
+            
+            async with self.client.beta.realtime.connect(
+                model="gpt-4o-realtime-preview"
+            ) as connection:
+                await self._start_moderator_turn(
+                    connection,
+                    audio_data,
+                    text_input,
+                    recent_context,
+                    room_participants,
+                    moderation_mode,
+                    context_summary,
+                )
+                
+                text_chunks = []
+                async for event in connection:
+                    if event.type == "response.text.delta":
+                        text_chunks.append(event.delta)
+                        yield {"delta": event.delta, "audio": None}
+                    elif event.type == "response.audio.delta":
+                        # Realtime audio deltas are already base64 PCM16
+                        yield {"delta": None, "audio": event.delta}
+                    elif event.type == "response.done":
+                        break
+                    elif event.type == "error":
+                        raise Exception(f"Realtime API error: {event.error}")
+            
+            text_response = "".join(text_chunks)
+            yield {
+                "done": True,
+                "text": text_response,
+                "moderation_type": moderation_mode,
+                "suggestions": self._extract_suggestions(text_response),
+                "timestamp": _utc_timestamp(),
+                "participants": room_participants,
+            }
+        
+        except Exception as e:
+            logger.error(f"❌ Streaming room moderation failed: {e}")
+            yield {"done": True, "error": str(e)}
+
+    async def _condense_room_context(
+        self,
+        room_id: Optional[str],
+        conversation_context: Optional[List[Dict[str, Any]]],
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Bound moderator input with a rolling summary of older room messages
+        
+        Once more than 6 messages are unsummarized, all but the last 3 are folded
+        into the room's running summary with one gpt-4o-mini call, so between 3 and
+        6 messages are ever sent verbatim regardless of room age.
+        
+        Args:
+            room_id: Room identifier (without it, the last 10 messages are used as before)
+            conversation_context: Full room conversation history
+            
+        Returns:
+            (messages to send verbatim, summary of earlier messages or None)
+        """
+        if not room_id or not conversation_context:
+            return conversation_context, None
+        
+        def fingerprint(msg: Dict[str, Any]) -> int:
+            return hash((msg.get("timestamp"), msg.get("role"), msg.get("content")))
+        
+        # Each room connection keeps its own history list, told apart by its first message
+        state_key = (room_id, fingerprint(conversation_context[0]))
+        
+        # Reuse the stored summary only if it still describes this history's prefix
+        summarized_count, summary = 0, None
+        state = self._room_summaries.get(state_key)
+        if state:
+            count, last_fingerprint, stored_summary = state
+            if (
+                0 < count <= len(conversation_context)
+                and fingerprint(conversation_context[count - 1]) == last_fingerprint
+            ):
+                summarized_count, summary = count, stored_summary
+        
+        pending = conversation_context[summarized_count:]
+        if len(pending) > 6:
+            to_fold = pending[:-3]
+            try:
+                transcript = "\n".join(
+                    f"{msg.get('role', 'user')}: {msg.get('content', '')}" for msg in to_fold
+                )
+                if summary:
+                    transcript = f"Existing summary: {summary}\n\nNew messages:\n{transcript}"
+                response = await self._create_chat_completion(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": _ROOM_SUMMARY_SYSTEM_PROMPT},
+                        {"role": "user", "content": transcript},
+                    ],
+                    max_tokens=200,
+                    temperature=0.3,
+                )
+                summary = response.choices[0].message.content
+                summarized_count += len(to_fold)
+                self._room_summaries[state_key] = (
+                    summarized_count,
+                    fingerprint(conversation_context[summarized_count - 1]),
+                    summary,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Room context summarization failed, sending recent messages: {e}")
+                return conversation_context[-10:], summary
+        
+        return conversation_context[summarized_count:], summary
+
+    async def _start_moderator_turn(
+        self,
+        connection,
+        audio_data: Optional[Union[bytes, str]],
+        text_input: Optional[str],
+        conversation_context: Optional[List[Dict[str, Any]]],
+        room_participants: Optional[List[str]],
+        moderation_mode: str,
+        context_summary: Optional[str] = None,
+    ) -> None:
+        """Configure a Realtime session with the room state and request one moderator response"""
+        # Configure session
+        await connection.session.update(
+            session={
+                "modalities": ["audio", "text"],
+                "voice": "shimmer",
+                "input_audio_format": "pcm16",
+                "output_audio_format": "pcm16",
+                "input_audio_transcription": {"model": "whisper-1"}
+            }
+        )
+        
+        # Static prompt first so its prefix is cacheable; room state goes last
+        for prompt_text in (
+            _MODERATION_SYSTEM_PROMPT,
+            f"Current mode: {moderation_mode}\n"
+            f"Current room participants: {', '.join(room_participants or [])}",
+        ):
+            await connection.conversation.item.create(
+                item={
+                    "type": "message",
+                    "role": "system",
+                    "content": [{"type": "input_text", "text": prompt_text}],
+                }
+            )
+        
+        # Older turns arrive pre-summarized
+        if context_summary:
+            await connection.conversation.item.create(
+                item={
+                    "type": "message",
+                    "role": "system",
+                    "content": [
+                        {
+                            "type": "input_text",
+                            "text": f"Summary of the earlier conversation: {context_summary}",
+                        }
+                    ],
+                }
+            )
+        
+        # Add conversation history
+        if conversation_context:
+            for msg in conversation_context[-10:]:  # Last 10 messages
+                await connection.conversation.item.create(
+                    item={
+                        "type": "message",
+                        "role": msg.get("role", "user"),
+                        "content": [
+                            {
+                                "type": "input_text",
+                                "text": msg.get("content", "")
+                            }
+                        ]
+                    }
+                )
+        
+        # Prepare user content
+        user_content = []
+        
+        # Add audio if provided
+        if audio_data:
+            # For moderation, use appendInputAudio instead of manual content creation
+            if isinstance(audio_data, str):
+                # Already base64, pass directly
+                await connection.input_audio_buffer.append(audio=audio_data)
+            else:
+                # Raw bytes, need to encode
+                await connection.input_audio_buffer.append(audio=await _to_b64(audio_data))
+        
+        # Add text if provided
+        if text_input:
+            user_content.append({"type": "input_text", "text": text_input})
+        
+        # Only create conversation item if we have text content
+        if user_content:
+            await connection.conversation.item.create(
+                item={
+                    "type": "message",
+                    "role": "user",
+                    "content": user_content
+                }
+            )
+        
+        # Request response generation (works with audio from appendInputAudio)
+        await connection.response.create()
+
     async def generate_ai_host_response(
         self,
         user_input: str,
@@ -457,6 +985,10 @@ The response should be natural, friendly, and helpful."""
                 f"🎭 Generating AI host response for state: {conversation_state}"
             )
 
+            user_context_json = orjson.dumps(
+                user_context or {}, option=orjson.OPT_INDENT_2
+            ).decode()
+
             # Define system prompts for different states
             system_prompts = {
                 "greeting": f"""You are Vortex, a friendly AI host. A user has just logged in. Your role is to:
@@ -465,7 +997,7 @@ The response should be natural, friendly, and helpful."""
 3. Ask what topics they'd like to discuss today
 4. Keep it conversational and engaging
 
-User context: {json.dumps(user_context or {}, indent=2)}
+User context: {user_context_json}
 Respond in a warm, natural tone.""",
                 "topic_inquiry": f"""You are Vortex, an AI host helping users find conversation topics. The user has responded to your greeting. Your role is to:
 1. Acknowledge their response
@@ -473,7 +1005,7 @@ Respond in a warm, natural tone.""",
 3. Ask follow-up questions to understand their interests better
 4. Guide them toward expressing clear topic preferences
 
-User context: {json.dumps(user_context or {}, indent=2)}
+User context: {user_context_json}
 Be encouraging and help them articulate their interests.""",
                 "matching": f"""You are Vortex, an AI host managing the matching process. Your role is to:
 1. Confirm the topics they want to discuss
@@ -481,7 +1013,7 @@ Be encouraging and help them articulate their interests.""",
 3. Provide encouraging updates about the matching process
 4. Keep them engaged while matching happens
 
-User context: {json.dumps(user_context or {}, indent=2)}
+User context: {user_context_json}
 Be positive and reassuring about finding great matches.""",
                 "hosting": f"""You are Vortex, an AI conversation host facilitating a live discussion. Your role is to:
 1. Guide the conversation flow
@@ -490,7 +1022,7 @@ Be positive and reassuring about finding great matches.""",
 4. Provide interesting facts or questions related to the topic
 5. Keep the atmosphere friendly and engaging
 
-User context: {json.dumps(user_context or {}, indent=2)}
+User context: {user_context_json}
 Be an active, helpful conversation facilitator.""",
             }
 
@@ -500,16 +1032,14 @@ Be an active, helpful conversation facilitator.""",
             )
 
             # Use GPT-4 for reliable text generation (save Realtime API for full audio interactions)
-            response = await asyncio.to_thread(
-                lambda: self.client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_input},
-                    ],
-                    max_tokens=200,
-                    temperature=0.7,
-                )
+            response = await self._create_chat_completion(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_input},
+                ],
+                max_tokens=200,
+                temperature=0.7,
             )
 
             response_text = response.choices[0].message.content
@@ -519,7 +1049,7 @@ Be an active, helpful conversation facilitator.""",
             return {
                 "response_text": response_text,
                 "conversation_state": conversation_state,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _utc_timestamp(),
             }
 
         except Exception as e:
@@ -540,7 +1070,7 @@ Be an active, helpful conversation facilitator.""",
                 ),
                 "conversation_state": conversation_state,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _utc_timestamp(),
             }
 
     async def generate_conversation_summary(
@@ -610,7 +1140,7 @@ Be an active, helpful conversation facilitator.""",
                 prompt += "."
 
             # Generate summary using GPT-4
-            response = await self.client.chat.completions.create(
+            response = await self._create_chat_completion(
                 model="gpt-4",
                 messages=[
                     {
@@ -710,41 +1240,52 @@ Be an active, helpful conversation facilitator.""",
 
     def _extract_suggestions(self, ai_text: str) -> List[str]:
         """Extract suggestions from AI response"""
+        hits = {match.group(1).lower() for match in _SUGGESTION_KEYWORDS_RE.finditer(ai_text)}
         suggestions = []
-        if "suggest" in ai_text.lower():
+        if "suggest" in hits:
             suggestions.append("💡 AI provided a suggestion")
-        if "topic" in ai_text.lower():
+        if "topic" in hits:
             suggestions.append("🎯 New topic recommendation")
-        if "fact" in ai_text.lower() or "info" in ai_text.lower():
+        if "fact" in hits or "info" in hits:
             suggestions.append("🔍 Fact checking")
         return suggestions
     
-    def health_check(self) -> Dict[str, Any]:
+    async def health_check(self) -> Dict[str, Any]:
         """
         Check OpenAI service health status
         
+        A healthy result is reused for a few seconds so probe storms cost one upstream call.
+        
         Returns:
             Health status information
         """
+        now = time.monotonic()
+        if self._healthy_status and now - self._healthy_at < _HEALTH_CHECK_TTL:
+            return self._healthy_status
+        
         try:
-            # Use traditional TTS API for connection test, avoiding complex GPT-4o Audio parameters
-            response = self.client.audio.speech.create(
-                model="tts-1", voice="alloy", input="Health check test"
+            # Cheap metadata lookup validates auth + connectivity without billing a synthesis
+            await asyncio.wait_for(
+                self.client.with_options(max_retries=2).models.retrieve("gpt-4o-audio-preview"),
+                timeout=3.0,
             )
             
-            return {
+            self._healthy_status = {
                 "status": "healthy",
-                "service": "openai_tts",
-                "model": "tts-1",
-                "timestamp": datetime.utcnow().isoformat(),
+                "service": "openai",
+                "model": "gpt-4o-audio-preview",
+                "timestamp": _utc_timestamp(),
             }
+            self._healthy_at = now
+            return self._healthy_status
         except Exception as e:
             logger.error(f"❌ OpenAI health check failed: {e}")
+            self._healthy_status = None
             return {
                 "status": "unhealthy",
                 "service": "openai_gpt4o_audio",
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "error": str(e) or type(e).__name__,
+                "timestamp": _utc_timestamp(),
             }
     
     async def text_to_speech(
@@ -764,18 +1305,24 @@ Be an active, helpful conversation facilitator.""",
         try:
             logger.info(f"🔊 Generating TTS: {text[:50]}...")
             
+            model = "tts-1-hd"  # High quality TTS
+            cache_key = self._tts_cache_key(model, voice, speed, text)
+            cached_audio = await self._tts_cache_get(cache_key)
+            if cached_audio is not None:
+                logger.info("✅ TTS served from cache")
+                return cached_audio
+            
             # Use traditional TTS API, more stable and reliable
-            response = await asyncio.to_thread(
-                lambda: self.client.audio.speech.create(
-                    model="tts-1-hd",  # High quality TTS
-                    voice=voice,
-                    input=text,
-                    speed=speed,
-                )
+            response = await self._create_speech(
+                model=model,
+                voice=voice,
+                input=text,
+                speed=speed,
             )
             
             # Return audio bytes directly
             audio_bytes = response.content
+            await self._tts_cache_set(cache_key, audio_bytes)
             logger.info("✅ TTS generated successfully")
             return audio_bytes
                 
@@ -783,6 +1330,55 @@ Be an active, helpful conversation facilitator.""",
             logger.error(f"❌ TTS generation failed: {e}")
             raise
 
+    async def text_to_speech_stream(
+        self, text: str, voice: str = "alloy", speed: float = 1.0
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream voice from OpenAI TTS API as it is synthesized
+        
+        Uses tts-1 rather than tts-1-hd for a lower time-to-first-byte.
+        
+        Args:
+            text: Text to convert
+            voice: Voice type
+            speed: Voice speed
+            
+        Yields:
+            MP3 audio chunks (bytes)
+        """
+        try:
+            logger.info(f"🔊 Streaming TTS: {text[:50]}...")
+            
+            model = "tts-1"
+            cache_key = self._tts_cache_key(model, voice, speed, text)
+            cached_audio = await self._tts_cache_get(cache_key)
+            if cached_audio is not None:
+                logger.info("✅ TTS stream served from cache")
+                yield cached_audio
+                return
+            
+            chunks = []
+            response = await self._open_speech_stream(
+                model=model,
+                voice=voice,
+                input=text,
+                speed=speed,
+            )
+            try:
+                async for chunk in response.iter_bytes(4096):
+                    chunks.append(chunk)
+                    yield chunk
+            finally:
+                await response.close()
+            
+            # Only cache streams the consumer read to completion
+            await self._tts_cache_set(cache_key, b"".join(chunks))
+            logger.info("✅ TTS stream completed")
+                
+        except Exception as e:
+            logger.error(f"❌ TTS streaming failed: {e}")
+            raise
+
     async def speech_to_text(
         self, audio_file: Union[bytes, io.BytesIO], language: str = "en-US"
     ) -> Dict[str, Any]:
@@ -801,22 +1397,40 @@ Be an active, helpful conversation facilitator.""",
             
             # Prepare audio data
             if isinstance(audio_file, bytes):
+                audio_bytes = audio_file
                 audio_buffer = io.BytesIO(audio_file)
                 audio_buffer.name = "audio.mp3"
             else:
+                audio_bytes = audio_file.getvalue()
                 audio_buffer = audio_file
             
+            # Bit-identical uploads (retries, shared clips) reuse the earlier transcription
+            cache_key = (hashlib.blake2b(audio_bytes, digest_size=16).digest(), language)
+            cached = self._stt_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"✅ STT served from cache: '{cached['text'][:100]}...'")
+                return dict(cached)
+            
+            # Shrink large uploads before sending them to Whisper
+            if len(audio_bytes) > _STT_TRANSCODE_THRESHOLD:
+                try:
+                    normalized = await asyncio.to_thread(_normalize_audio, audio_bytes)
+                    if normalized and len(normalized) < len(audio_bytes):
+                        logger.info(f"🎚️ Audio normalized for STT: {len(audio_bytes)} → {len(normalized)} bytes")
+                        audio_buffer = io.BytesIO(normalized)
+                        audio_buffer.name = "audio.ogg"
+                except Exception as e:
+                    logger.warning(f"⚠️ Audio normalization failed, uploading original: {e}")
+            
             # Use OpenAI Whisper for STT
-            response = await asyncio.to_thread(
-                lambda: self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_buffer,
-                    language=language.split("-")[0]
-                    if language
-                    else None,  # Convert en-US to en
-                    response_format="verbose_json",
-                    timestamp_granularities=["word"],
-                )
+            response = await self._create_transcription(
+                model="whisper-1",
+                file=audio_buffer,
+                language=language.split("-")[0]
+                if language
+                else None,  # Convert en-US to en
+                response_format="verbose_json",
+                timestamp_granularities=["word"],
             )
             
             # Extract response data
@@ -834,13 +1448,15 @@ Be an active, helpful conversation facilitator.""",
             
             logger.info(f"✅ STT completed: '{transcription[:100]}...'")
             
-            return {
+            result = {
                 "text": transcription,
                 "language": detected_language,
                 "duration": duration,
                 "confidence": 0.95,  # Whisper doesn't provide confidence, use default
                 "words": words,
             }
+            self._stt_cache[cache_key] = result
+            return dict(result)
             
         except Exception as e:
             logger.error(f"❌ Speech-to-text failed: {e}")
@@ -850,7 +1466,7 @@ Be an active, helpful conversation facilitator.""",
         self, text: str, context: Dict[str, Any] = None, language: str = "en-US"
     ) -> Dict[str, Any]:
         """
-        Extract topics and generate hashtags from text using GPT-4
+        Extract topics and generate hashtags from text using GPT-4o mini
         
         Args:
             text: Input text to analyze
@@ -863,71 +1479,25 @@ Be an active, helpful conversation facilitator.""",
         try:
             logger.info(f"🧠 Extracting topics from text: {text[:100]}...")
             
-            # Build context prompt
-            context_info = ""
-            if context:
-                context_info = f"\nUser context: {json.dumps(context, indent=2)}"
-            
-            # Use GPT-4 for topic extraction
-            response = await asyncio.to_thread(
-                lambda: self.client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": f"""You are Vortex, an expert at analyzing conversation topics and generating relevant hashtags for social matching.
-
-Your task is to analyze the user's input and extract:
-1. Main topics (3-5 specific topics)
-2. Relevant hashtags (5-8 hashtags for matching)
-3. Category classification
-4. Sentiment analysis
-5. Conversation style preference
-
-Please respond in JSON format:
-{{
-    "main_topics": ["Topic1", "Topic2", "Topic3"],
-    "hashtags": ["#hashtag1", "#hashtag2", "#hashtag3", "#hashtag4", "#hashtag5"],
-    "category": "technology|business|lifestyle|entertainment|education|sports|health|travel|other",
-    "sentiment": "positive|negative|neutral",
-    "conversation_style": "casual|professional|academic|creative",
-    "confidence": 0.95,
-    "summary": "Brief summary of what the user wants to discuss"
-}}
-
-Language preference: {language}
-Focus on creating hashtags that will help match users with similar interests.{context_info}""",
-                        },
-                        {
-                            "role": "user",
-                            "content": f"Please analyze this text and extract topics/hashtags: {text}",
-                        },
-                    ],
-                    max_tokens=500,
-                    temperature=0.3,
-                )
-            )
-            
-            # Parse the response
-            content = response.choices[0].message.content
-            
+            # Near-duplicate inputs with the same language and context reuse an earlier
+            # extraction instead of a model call
+            embedding = None
             try:
-                result = json.loads(content)
-                logger.info(f"✅ Topics extracted: {result.get('main_topics', [])}")
-                return result
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse JSON response, creating fallback")
-                # Fallback parsing
-                return {
-                    "main_topics": ["general", "conversation"],
-                    "hashtags": ["#chat", "#social", "#conversation"],
-                    "category": "other", 
-                    "sentiment": "neutral",
-                    "conversation_style": "casual",
-                    "confidence": 0.5,
-                    "summary": "General conversation topic",
-                    "raw_response": content,
-                }
+                scope = self._topic_cache_scope(context, language)
+                embedding = await self._embed(text)
+                cached = self._topic_cache.lookup(embedding, scope=scope)
+                if cached:
+                    logger.info(f"✅ Topics served from semantic cache: {cached.get('main_topics', [])}")
+                    return copy.deepcopy(cached)
+            except Exception as e:
+                logger.warning(f"⚠️ Semantic cache lookup failed: {e}")
+            
+            # Concurrent callers are coalesced into a single call
+            result = await self._topic_batcher.submit((text, context, language))
+            if embedding is not None:
+                self._topic_cache.add(embedding, copy.deepcopy(result), scope=scope)
+            logger.info(f"✅ Topics extracted: {result.get('main_topics', [])}")
+            return result
                 
         except Exception as e:
             logger.error(f"❌ Topic extraction failed: {e}")
@@ -943,6 +1513,153 @@ Focus on creating hashtags that will help match users with similar interests.{co
                 "error": str(e),
             }
 
+    async def _extract_topics_single(
+        self, text: str, context: Optional[Dict[str, Any]], language: str
+    ) -> Dict[str, Any]:
+        """Run topic extraction for one input"""
+        # Build context prompt
+        context_info = ""
+        if context:
+            context_info = f"\nUser context: {orjson.dumps(context, option=orjson.OPT_INDENT_2).decode()}"
+        
+        # Use GPT-4o mini in JSON mode for topic extraction; per-call details stay
+        # in the user turn so the static system prompt remains a cacheable prefix
+        response = await self._create_chat_completion(
+            model="gpt-4o-mini",
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _TOPIC_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": f"Please analyze this text and extract topics/hashtags: {text}"
+                    f"\n\nLanguage preference: {language}{context_info}",
+                },
+            ],
+            max_tokens=500,
+            temperature=0.3,
+        )
+        
+        result = orjson.loads(response.choices[0].message.content)
+        if not isinstance(result, dict):
+            raise ValueError(f"expected a JSON object, got {type(result).__name__}")
+        return result
+
+    async def _extract_topics_batch(
+        self, items: List[Tuple[str, Optional[Dict[str, Any]], str]]
+    ) -> List[Any]:
+        """
+        BatchQueue handler: extract topics for several inputs in one chat call
+        
+        Args:
+            items: (text, context, language) tuples
+            
+        Returns:
+            One topic dict (or exception) per item, in order
+        """
+        if len(items) == 1:
+            text, context, language = items[0]
+            try:
+                return [await self._extract_topics_single(text, context, language)]
+            except Exception as e:
+                return [e]
+        
+        logger.info(f"🧠 Extracting topics for a batch of {len(items)} inputs")
+        inputs = [
+            {"text": text, "language": language, "context": context or {}}
+            for text, context, language in items
+        ]
+        # No bytes arrive until the whole batch is generated, so the read timeout
+        # grows with the output budget
+        max_tokens = min(500 * len(items), _TOPIC_BATCH_MAX_TOKENS)
+        timeout = httpx.Timeout(
+            _DEFAULT_TIMEOUT.read + max_tokens / _TOPIC_BATCH_TOKENS_PER_SECOND, connect=5.0
+        )
+        # API errors propagate so every caller in the batch fails together instead
+        # of fanning out into one retried call per input
+        response = await self._create_chat_completion(
+            model="gpt-4o-mini",
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _TOPIC_SYSTEM_PROMPT},
+                {"role": "system", "content": _TOPIC_BATCH_INSTRUCTIONS},
+                {"role": "user", "content": orjson.dumps(inputs).decode()},
+            ],
+            max_tokens=max_tokens,
+            temperature=0.3,
+            timeout=timeout,
+        )
+        try:
+            results = orjson.loads(response.choices[0].message.content)["results"]
+            if not isinstance(results, list) or len(results) != len(items):
+                raise ValueError(f"expected a list of {len(items)} results")
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            # Malformed batch output: answer each input individually instead
+            logger.warning(f"Batch topic extraction failed, retrying inputs individually: {e}")
+            return await asyncio.gather(
+                *(self._extract_topics_single(*item) for item in items),
+                return_exceptions=True,
+            )
+        
+        # Re-run only the inputs whose result isn't a JSON object
+        malformed = [i for i, result in enumerate(results) if not isinstance(result, dict)]
+        if malformed:
+            logger.warning(f"Batch topic extraction returned {len(malformed)} malformed results, retrying them individually")
+            retried = await asyncio.gather(
+                *(self._extract_topics_single(*items[i]) for i in malformed),
+                return_exceptions=True,
+            )
+            for i, result in zip(malformed, retried):
+                results[i] = result
+        return results
+
+    async def _gpt4o_audio_extract(
+        self, audio_base64: str, fmt: str, language: str = "en-US"
+    ) -> Dict[str, Any]:
+        """
+        Understand audio and extract topics/hashtags in a single GPT-4o Audio call
+        
+        Text-only response (no audio synthesis), forced to a JSON object.
+        
+        Args:
+            audio_base64: Base64 encoded audio
+            fmt: Input audio format accepted by GPT-4o Audio (wav, mp3)
+            language: Language preference
+            
+        Returns:
+            Parsed JSON with understood_text, extracted_topics, generated_hashtags,
+            category, sentiment, conversation_style, summary and text_response
+            
+        Raises:
+            openai.BadRequestError: If the model rejects the request or audio
+            ValueError: If the model returns malformed or truncated JSON
+        """
+        response = await self._create_chat_completion(
+            model="gpt-4o-audio-preview",
+            modalities=["text"],
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _MATCHING_SYSTEM_PROMPT},
+                {"role": "system", "content": f"Language preference: {language}"},
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "input_audio",
+                            "input_audio": {"data": audio_base64, "format": fmt},
+                        }
+                    ],
+                },
+            ],
+            max_tokens=500,
+            temperature=0.3,
+            timeout=_AUDIO_INPUT_TIMEOUT,
+        )
+        
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            raise ValueError("GPT-4o Audio reply hit max_tokens before the JSON was complete")
+        return orjson.loads(choice.message.content)
+
     async def process_voice_for_hashtags(
         self,
         audio_data: Union[bytes, io.BytesIO],
@@ -953,8 +1670,8 @@ Focus on creating hashtags that will help match users with similar interests.{co
         Process voice input to extract hashtags and topics for matching
         
         This is the main voice-to-hashtag pipeline:
-        1. Voice → STT (Whisper)
-        2. Text → Topic Extraction (GPT-4)
+        1. Voice → GPT-4o Audio (understanding + topics + hashtags in one call)
+        2. Fallback for long clips or rejection/malformed/truncated JSON: Voice → STT (Whisper) → Topic Extraction (GPT-4o mini)
         3. Return topics + hashtags for matching
         
         Args:
@@ -968,7 +1685,72 @@ Focus on creating hashtags that will help match users with similar interests.{co
         try:
             logger.info("🎙️ Processing voice input for hashtag extraction...")
             
-            # Step 1: Speech to Text
+            input_format = _GPT4O_AUDIO_INPUT_FORMATS.get(audio_format.lower())
+            audio_bytes = (
+                audio_data.getvalue()
+                if isinstance(audio_data, io.BytesIO)
+                else audio_data
+            )
+            if input_format and len(audio_bytes) <= _GPT4O_AUDIO_MAX_BYTES:
+                try:
+                    extracted = await self._gpt4o_audio_extract(
+                        await _to_b64(audio_bytes),
+                        input_format,
+                        language,
+                    )
+                    transcription = extracted.get("understood_text", "")
+                    
+                    if not transcription.strip():
+                        return {
+                            "transcription": "",
+                            "main_topics": [],
+                            "hashtags": [],
+                            "error": "No speech detected in audio",
+                        }
+                    
+                    result = {
+                        "transcription": transcription,
+                        "language": language,
+                        "duration": 0.0,  # GPT-4o Audio doesn't report duration
+                        "confidence": 0.9,
+                        "main_topics": extracted.get("extracted_topics", []),
+                        "hashtags": extracted.get("generated_hashtags", []),
+                        "category": extracted.get("category", "other"),
+                        "sentiment": extracted.get("sentiment", "neutral"),
+                        "conversation_style": extracted.get("conversation_style", "casual"),
+                        "summary": extracted.get("summary", transcription[:100]),
+                    }
+                    
+                    # Later text requests with a similar transcript can reuse these topics;
+                    # the embedding runs in the background instead of delaying the response
+                    self._spawn(self._remember_topics(
+                        transcription,
+                        # Same context the Whisper fallback below sends to topic extraction
+                        {
+                            "source": "voice_input",
+                            "language": language,
+                            "audio_format": audio_format,
+                        },
+                        language,
+                        {
+                            "main_topics": result["main_topics"],
+                            "hashtags": result["hashtags"],
+                            "category": result["category"],
+                            "sentiment": result["sentiment"],
+                            "conversation_style": result["conversation_style"],
+                            "confidence": result["confidence"],
+                            "summary": result["summary"],
+                        },
+                    ))
+                    
+                    logger.info(
+                        f"✅ Voice processing completed with GPT-4o Audio: {len(result['hashtags'])} hashtags generated"
+                    )
+                    return result
+                except (openai.BadRequestError, ValueError) as e:
+                    logger.warning(f"GPT-4o Audio extraction failed, falling back to Whisper + topic extraction: {e}")
+            
+            # Fallback Step 1: Speech to Text
             stt_result = await self.speech_to_text(audio_data, language)
             transcription = stt_result["text"]
             
@@ -980,7 +1762,7 @@ Focus on creating hashtags that will help match users with similar interests.{co
                     "error": "No speech detected in audio",
                 }
             
-            # Step 2: Extract topics and hashtags from transcription
+            # Fallback Step 2: Extract topics and hashtags from transcription
             topic_result = await self.extract_topics_and_hashtags(
                 text=transcription,
                 context={
@@ -988,6 +1770,7 @@ Focus on creating hashtags that will help match users with similar interests.{co
                     "language": language,
                     "audio_format": audio_format,
                 },
+                language=language,
             )
             
             # Combine results
@@ -1046,7 +1829,7 @@ Focus on creating hashtags that will help match users with similar interests.{co
             try:
                 # Use OpenAI Whisper for STT
                 with open(temp_filename, "rb") as audio_file:
-                    transcription = await self.async_client.audio.transcriptions.create(
+                    transcription = await self._create_transcription(
                         model="whisper-1",
                         file=audio_file,
                         language=language,
@@ -1115,7 +1898,7 @@ Focus on creating hashtags that will help match users with similar interests.{co
             logger.info(f"🤖 Starting realtime conversation with GPT-4o Realtime API")
             
             # Use GPT-4o Realtime API instead of ChatCompletion
-            async with self.async_client.beta.realtime.connect(
+            async with self.client.beta.realtime.connect(
                 model="gpt-4o-realtime-preview"
             ) as connection:
                 # Enable text + audio modalities if audio response requested
@@ -1217,7 +2000,7 @@ Focus on creating hashtags that will help match users with similar interests.{co
                 
                 result = {
                     "response_text": ai_text,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _utc_timestamp(),
                     "model": "gpt-4o-realtime-preview"
                 }
                 
@@ -1225,7 +2008,7 @@ Focus on creating hashtags that will help match users with similar interests.{co
                 if audio_data and audio_response:
                     # Convert raw PCM16 to WAV format for iOS compatibility
                     wav_audio = self._pcm16_to_wav(audio_data)
-                    result["audio_data"] = base64.b64encode(wav_audio).decode("utf-8")
+                    result["audio_data"] = await _to_b64(wav_audio)
                     result["audio_format"] = "wav"
                     logger.info(f"✅ Audio converted to WAV format: {len(wav_audio)} bytes")
                 
@@ -1237,7 +2020,7 @@ Focus on creating hashtags that will help match users with similar interests.{co
             return {
                 "response_text": "I'm having trouble processing that right now. Could you try again?",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _utc_timestamp()
             }
     
     def _build_conversation_system_prompt(self, user_context: Dict[str, Any] = None) -> str:
@@ -1354,14 +2137,8 @@ def get_openai_service() -> OpenAIService:
         logger.info("🎵 [get_openai_service] Creating OpenAI service instance...")
         service = OpenAIService(api_key=api_key)
         
-        # Test the service by doing a simple health check
-        try:
-            health_status = service.health_check()
-            if health_status.get("status") != "healthy":
-                logger.warning(f"⚠️ [get_openai_service] Service health check failed: {health_status}")
-        except Exception as health_error:
-            logger.warning(f"⚠️ [get_openai_service] Health check failed but continuing: {health_error}")
-        
+        # health_check() is async now; callers on the event loop probe it themselves
+
         logger.info("✅ [get_openai_service] OpenAI service created successfully")
         return service
         
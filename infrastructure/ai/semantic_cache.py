@@ -0,0 +1,93 @@
+"""
+Semantic Cache for AI responses
+Nearest-neighbour lookup over text embeddings so near-duplicate queries reuse earlier results
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence
+
+import hnswlib
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """In-memory cosine-similarity cache backed by an HNSW index"""
+
+    def __init__(self, dim: int, max_elements: int = 10000, threshold: float = 0.92):
+        """
+        Initialize semantic cache
+
+        Args:
+            dim: Embedding dimensionality
+            max_elements: Maximum cached entries (oldest are evicted first)
+            threshold: Minimum cosine similarity for a cache hit
+        """
+        self.dim = dim
+        self.max_elements = max_elements
+        self.threshold = threshold
+
+        self._index = hnswlib.Index(space="cosine", dim=dim)
+        self._index.init_index(
+            max_elements=max_elements, ef_construction=200, M=16, allow_replace_deleted=True
+        )
+        self._index.set_ef(50)
+
+        # Insertion-ordered so eviction drops the oldest entry
+        self._entries: "OrderedDict[int, Any]" = OrderedDict()
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(
+        self, embedding: Sequence[float], scope: Hashable = None, k: int = 8
+    ) -> Optional[Any]:
+        """
+        Return the value stored for the most similar embedding in a scope, if similar enough
+
+        Args:
+            embedding: Query embedding
+            scope: Only entries added with an equal scope can match
+            k: Nearest neighbours to consider when looking for a matching scope
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        if not self._entries:
+            return None
+
+        labels, distances = self._index.knn_query(
+            np.asarray(embedding, dtype=np.float32), k=min(k, len(self._entries))
+        )
+        for label, distance in zip(labels[0], distances[0]):
+            similarity = 1.0 - float(distance)
+            if similarity < self.threshold:
+                break
+            entry = self._entries.get(int(label))
+            if entry is not None and entry[0] == scope:
+                logger.debug(f"🎯 Semantic cache hit (similarity={similarity:.3f})")
+                return entry[1]
+        return None
+
+    def add(self, embedding: Sequence[float], value: Any, scope: Hashable = None) -> None:
+        """
+        Insert an embedding and its value, evicting the oldest entry when full
+
+        Args:
+            embedding: Embedding of the cached query
+            value: Value to return on future hits
+            scope: Key that lookups must match exactly (e.g. request parameters)
+        """
+        if len(self._entries) >= self.max_elements:
+            oldest_id, _ = self._entries.popitem(last=False)
+            self._index.mark_deleted(oldest_id)
+
+        item_id = self._next_id
+        self._next_id += 1
+        self._index.add_items(
+            np.asarray([embedding], dtype=np.float32), [item_id], replace_deleted=True
+        )
+        self._entries[item_id] = (scope, value)
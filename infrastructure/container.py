@@ -250,6 +250,11 @@ class Container:
             if hasattr(livekit_service, 'disconnect'):
                 livekit_service.disconnect()
             
+            # Close OpenAI HTTP connection pool
+            openai_service = self.get_openai_service()
+            if openai_service:
+                await openai_service.aclose()
+            
             logger.info("✅ Services shutdown completed")
             
         except Exception as e: